@@ -1,9 +1,25 @@
 from PIL import Image
+import io
 import os
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.utils import ImageReader
-import glob
+
+def _find_card_files(finals_path):
+    """Return the sorted paths of all bingo card PNGs in finals_path."""
+    with os.scandir(finals_path) as entries:
+        return sorted(entry.path for entry in entries
+                      if entry.name.startswith("bingo_card_") and entry.name.endswith(".png"))
+
+def _thumbnail_reader(card_file, size):
+    """Downscale a card to fit size (in pixels) and return it as a JPEG ImageReader."""
+    img = Image.open(card_file)
+    img.thumbnail(size, Image.LANCZOS)
+    
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=85)
+    buffer.seek(0)
+    return ImageReader(buffer)
 
 def create_bingo_pdf():
     """Create a PDF from all bingo cards in the finals folder."""
@@ -15,8 +31,7 @@ def create_bingo_pdf():
         return
     
     # Find all bingo card PNG files
-    card_files = glob.glob(os.path.join(finals_path, "bingo_card_*.png"))
-    card_files.sort()  # Sort to ensure consistent order
+    card_files = _find_card_files(finals_path)  # Sorted to ensure consistent order
     
     if not card_files:
         print("Error: No bingo card files found in finals folder!")
@@ -35,31 +50,10 @@ def create_bingo_pdf():
         print(f"Adding card {i+1}/{len(card_files)}: {os.path.basename(card_file)}")
         
         try:
-            # Open the image
-            img = Image.open(card_file)
-            
-            # Calculate scaling to fit full page
-            max_width = page_width
-            max_height = page_height
-            
-            # Get image dimensions
-            img_width, img_height = img.size
-            
-            # Calculate scale factor to fit the page while maintaining aspect ratio
-            scale_x = max_width / img_width
-            scale_y = max_height / img_height
-            scale = min(scale_x, scale_y)
-            
-            # Calculate final dimensions
-            final_width = img_width * scale
-            final_height = img_height * scale
-            
-            # Calculate position to center the image
-            x = (page_width - final_width) / 2
-            y = (page_height - final_height) / 2
-            
-            # Add image to PDF
-            c.drawImage(ImageReader(img), x, y, width=final_width, height=final_height)
+            # Fit the image to the full page; ReportLab keeps the aspect
+            # ratio and centers it, so no manual scaling is needed
+            c.drawImage(ImageReader(card_file), 0, 0, width=page_width, height=page_height,
+                        preserveAspectRatio=True, anchor='c', mask='auto')
             
             # Start new page for next card (except for the last one)
             if i < len(card_files) - 1:
@@ -85,8 +79,7 @@ def create_multiple_per_page_pdf():
         return
     
     # Find all bingo card PNG files
-    card_files = glob.glob(os.path.join(finals_path, "bingo_card_*.png"))
-    card_files.sort()
+    card_files = _find_card_files(finals_path)
     
     if not card_files:
         print("Error: No bingo card files found in finals folder!")
@@ -113,19 +106,22 @@ def create_multiple_per_page_pdf():
         (margin + card_width + margin, page_height - margin - 2 * card_height - margin)  # Bottom right
     ]
     
+    # Pixel size of one grid cell when printed at 300 DPI (72 points = 1 inch)
+    thumbnail_size = (round(card_width * 300 / 72), round(card_height * 300 / 72))
+    
     cards_on_page = 0
     page_num = 1
     
     for i, card_file in enumerate(card_files):
         try:
-            # Open the image
-            img = Image.open(card_file)
-            
             # Get position for this card
             pos_x, pos_y = positions[cards_on_page]
             
-            # Add image to PDF
-            c.drawImage(ImageReader(img), pos_x, pos_y, width=card_width, height=card_height)
+            # Add a copy downscaled to the cell size, so only the pixels
+            # that will actually print are embedded
+            c.drawImage(_thumbnail_reader(card_file, thumbnail_size), pos_x, pos_y,
+                        width=card_width, height=card_height,
+                        preserveAspectRatio=True, anchor='c', mask='auto')
             
             # Add card label
             c.setFont("Helvetica", 8)
@@ -1,18 +1,32 @@
-import random
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import Rectangle
 import textwrap
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import os
+import re
+import math
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Resolution bingo.png is drawn for, and the faster resolution used for drafts
+TEMPLATE_DPI = 300
+DRAFT_DPI = 150
+
+# Bingo cards are GRID_SIZE x GRID_SIZE squares
+GRID_SIZE = 5
+
+# Squares in bingo.txt are separated by one or more blank lines
+_SPLIT = re.compile(r'\n[ \t]*\n+')
 
 def parse_bingo_file(filename):
     """Parse the bingo.txt file and return a list of squares."""
     with open(filename, 'r', encoding='utf-8') as file:
         content = file.read()
     
-    # Split by double newlines to get individual squares
-    squares = [square.strip() for square in content.split('\n\n') if square.strip()]
+    # Split on blank lines (including ones holding stray spaces) to get individual squares
+    squares = [square.strip() for square in _SPLIT.split(content) if square.strip()]
     
     return squares
 
@@ -30,6 +44,17 @@ def format_square_text(square_text):
         # More than two lines - treat as single text block
         return [(square_text, 60)]
 
+@functools.lru_cache(maxsize=4096)
+def _text_width(font, text):
+    """Return the horizontal advance of text, cached per font and string."""
+    return font.getlength(text)
+
+@functools.lru_cache(maxsize=64)
+def _line_height(font):
+    """Return the ascent-to-descent height of a line of text in font."""
+    bbox = font.getbbox('Ay')
+    return bbox[3] - bbox[1]
+
 def wrap_text_pil(text, font, max_width):
     """Wrap text to fit within max_width using PIL, preserving word boundaries."""
     # Pre-process text to handle slashes as natural break points
@@ -50,8 +75,7 @@ def wrap_text_pil(text, font, max_width):
     
     for word in words:
         test_line = ' '.join(current_line + [word])
-        bbox = font.getbbox(test_line)
-        width = bbox[2] - bbox[0]
+        width = _text_width(font, test_line)
         
         if width <= max_width:
             current_line.append(word)
@@ -62,8 +86,7 @@ def wrap_text_pil(text, font, max_width):
                 current_line = [word]
             else:
                 # Single word is too long - only break if absolutely necessary
-                word_bbox = font.getbbox(word)
-                word_width = word_bbox[2] - word_bbox[0]
+                word_width = _text_width(font, word)
                 
                 if word_width > max_width and len(word) > 12:  # Only break very long words
                     # Try to break at natural points (hyphens, etc.) first
@@ -91,41 +114,31 @@ def wrap_text_pil(text, font, max_width):
     
     return lines
 
+# Matches **bold** spans, including ones that cross a line break; the bold text itself is captured
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*', re.DOTALL)
+
+@functools.lru_cache(maxsize=1024)
 def parse_bold_text(text):
-    """Parse text for **bold** formatting and return segments with formatting info."""
+    """Parse text for **bold** formatting and return a tuple of (text, is_bold) segments."""
     segments = []
-    current_pos = 0
+    last_end = 0
     
-    while current_pos < len(text):
-        # Find next bold marker
-        bold_start = text.find('**', current_pos)
-        
-        if bold_start == -1:
-            # No more bold text, add remaining as normal
-            if current_pos < len(text):
-                segments.append((text[current_pos:], False))
-            break
-        
+    for match in _BOLD_RE.finditer(text):
         # Add text before bold marker as normal
-        if bold_start > current_pos:
-            segments.append((text[current_pos:bold_start], False))
-        
-        # Find closing bold marker
-        bold_end = text.find('**', bold_start + 2)
+        if match.start() > last_end:
+            segments.append((text[last_end:match.start()], False))
         
-        if bold_end == -1:
-            # No closing marker, treat as normal text
-            segments.append((text[bold_start:], False))
-            break
+        # Add bold text (without the ** markers), only if not empty
+        if match.group(1):
+            segments.append((match.group(1), True))
         
-        # Add bold text (without the ** markers)
-        bold_text = text[bold_start + 2:bold_end]
-        if bold_text:  # Only add if not empty
-            segments.append((bold_text, True))
-        
-        current_pos = bold_end + 2
+        last_end = match.end()
+    
+    # Add remaining text (including any unclosed marker) as normal
+    if last_end < len(text):
+        segments.append((text[last_end:], False))
     
-    return segments
+    return tuple(segments)
 
 def draw_text_with_bold(draw, text, x, y, font_normal, font_bold, color='black'):
     """Draw text with bold formatting support."""
@@ -139,13 +152,16 @@ def draw_text_with_bold(draw, text, x, y, font_normal, font_bold, color='black')
         draw.text((current_x, y), segment_text, fill=color, font=font)
         
         # Move x position for next segment
-        bbox = font.getbbox(segment_text)
-        current_x += bbox[2] - bbox[0]
+        current_x += _text_width(font, segment_text)
     
     return current_x  # Return final x position
 
+@functools.lru_cache(maxsize=2048)
 def wrap_text_with_bold(text, font_normal, font_bold, max_width):
-    """Wrap text with bold formatting support and slash breaking."""
+    """Wrap text with bold formatting support and slash breaking.
+    
+    Results are cached, so lines are returned as tuples of (word, is_bold) pairs.
+    """
     segments = parse_bold_text(text)
     lines = []
     current_line = []
@@ -172,8 +188,7 @@ def wrap_text_with_bold(text, font_normal, font_bold, max_width):
             test_words = [item[0] for item in current_line] + [word]
             test_text = ' '.join(test_words)
             test_font = font_bold if word_is_bold else font_normal
-            bbox = test_font.getbbox(test_text)
-            test_width = bbox[2] - bbox[0]
+            test_width = _text_width(test_font, test_text)
             
             if test_width <= max_width or not current_line:
                 current_line.append((word, word_is_bold))
@@ -182,156 +197,241 @@ def wrap_text_with_bold(text, font_normal, font_bold, max_width):
                 # Start new line
                 lines.append(current_line)
                 current_line = [(word, word_is_bold)]
-                bbox = font.getbbox(word)
-                current_line_width = bbox[2] - bbox[0]
+                current_line_width = _text_width(font, word)
     
     if current_line:
         lines.append(current_line)
     
-    return lines
+    return tuple(tuple(line) for line in lines)
 
-def create_bingo_card(squares):
-    """Create a 5x5 bingo card with the first square as free space in center."""
-    # Remove the free space from squares list for shuffling
-    free_space = squares[0] if squares else "FREE"
-    other_squares = squares[1:] if len(squares) > 1 else []
-    
-    # We need 24 squares (25 total - 1 free space)
-    if len(other_squares) < 24:
-        # If we don't have enough squares, repeat some
-        while len(other_squares) < 24:
-            other_squares.extend(squares[1:min(len(squares), 24)])
-        other_squares = other_squares[:24]
-    else:
-        # If we have more than 24, randomly select 24
-        other_squares = random.sample(other_squares, 24)
+def _wrapped_line_width(line_segments, font_normal, font_bold):
+    """Return the drawn width of a wrapped line of (word, is_bold) segments."""
+    width = 0
+    for j, (word, is_bold) in enumerate(line_segments):
+        font = font_bold if is_bold else font_normal
+        width += _text_width(font, word + (' ' if j < len(line_segments) - 1 else ''))
+    return width
+
+@functools.lru_cache(maxsize=None)
+def _warn_clipped(text):
+    """Warn (once per process) that a square is too wide for its cell and will be cut off."""
+    print(f"Warning: {text!r} is too wide for its cell even at the smallest size and will be cut off")
+
+def choose_fit(text, tiers, max_width, max_lines, max_height=None, line_spacing=4):
+    """Pick the largest font tier whose wrapped text fits, falling back to the smallest.
     
-    # Shuffle the squares
-    random.shuffle(other_squares)
+    tiers is a sequence of (font_normal, font_bold) pairs, largest first. Text fits a
+    tier when it wraps to at most max_lines lines, no line is wider than max_width
+    (wrapping never splits a word, so a single long word can be), and, if max_height
+    is given, those lines stack within max_height. Returns (font_normal, font_bold, lines).
+    """
+    for font_normal, font_bold in tiers:
+        lines = wrap_text_with_bold(text, font_normal, font_bold, max_width)
+        if len(lines) > max_lines:
+            continue
+        if any(_wrapped_line_width(line, font_normal, font_bold) > max_width for line in lines):
+            continue
+        if max_height is not None and len(lines) * (_line_height(font_normal) + line_spacing) > max_height:
+            continue
+        return font_normal, font_bold, lines
     
-    # Create 5x5 grid
-    card = []
-    square_index = 0
+    return font_normal, font_bold, lines
+
+# Flat indices of the 24 non-free cells of a 5x5 card (center is index 12)
+_NON_FREE_CELLS = np.r_[0:12, 13:25]
+
+def generate_card_indices(num_squares, num_cards, rng):
+    """Pick the 24 non-free squares for every card as indices into squares[1:].
     
-    for row in range(5):
-        card_row = []
-        for col in range(5):
-            if row == 2 and col == 2:  # Center position (free space)
-                card_row.append(free_space)
-            else:
-                card_row.append(other_squares[square_index])
-                square_index += 1
-        card.append(card_row)
+    Returns a (num_cards, 24) array with one row per card, in card order. Cards
+    get distinct sets of squares when the pool has enough of them, otherwise
+    distinct arrangements. If there are fewer than 24 squares, some repeat.
+    """
+    if num_squares <= 0:
+        raise ValueError("bingo.txt needs at least one square besides the free space")
+    
+    # We need 24 squares (25 total - 1 free space); repeat some if there aren't enough
+    pool = np.resize(np.arange(num_squares), max(num_squares, 24))
     
-    return card
+    # Small pools run out of distinct sets quickly, and a single square can't vary at all
+    distinct_sets = num_squares >= 24 and math.comb(num_squares, 24) >= num_cards
+    enforce_unique = num_squares > 1
+    
+    card_indices = np.empty((num_cards, 24), dtype=np.int32)
+    seen = set()
+    count = 0
+    while count < num_cards:
+        row = rng.permutation(pool)[:24]
+        key = tuple(sorted(row)) if distinct_sets else tuple(row)
+        if enforce_unique and key in seen:
+            continue
+        
+        seen.add(key)
+        card_indices[count] = row
+        count += 1
+    
+    return card_indices
 
-def draw_bingo_on_template(card, template_path, output_path, bingo_start_y=950):
-    """Draw a bingo card on the template image."""
-    # Load template
-    template = Image.open(template_path)
-    template = template.convert('RGB')
+def create_bingo_card(squares, indices):
+    """Create a 5x5 bingo card with the first square as free space in center.
     
-    # Create drawing context
-    draw = ImageDraw.Draw(template)
+    indices holds the positions in squares[1:] of the other 24 squares, in card order.
+    """
+    free_space = squares[0] if len(squares) else "FREE"
+    other_squares = np.asarray(squares[1:], dtype=object)
     
-    # Calculate bingo card dimensions and position
-    template_width, template_height = template.size
-    card_width = int(template_width * 0.85)  # 85% of template width for good fit
-    card_height = card_width  # Square card
+    # Create 5x5 grid with the free space in the center
+    card = np.empty(25, dtype=object)
+    card[12] = free_space
+    card[_NON_FREE_CELLS] = other_squares[indices]
     
-    # Center horizontally
-    card_x = (template_width - card_width) // 2
-    card_y = bingo_start_y
+    return card.reshape(5, 5)
+
+def load_fonts(scale=1.0):
+    """Load the normal and bold fonts for each size tier, keyed by tier name.
     
-    # Grid settings
-    grid_size = 5
-    cell_width = card_width // grid_size
-    cell_height = card_height // grid_size
+    Font sizes are tuned for the 300 DPI template and multiplied by scale.
+    """
+    fonts = {}
+    large, medium, small = round(70 * scale), round(60 * scale), round(50 * scale)
     
     # Try to load Goudy Old Style font, fallback to default
     try:
-        font_large = ImageFont.truetype("C:/Windows/Fonts/GOUDOS.TTF", size=70)
-        font_medium = ImageFont.truetype("C:/Windows/Fonts/GOUDOS.TTF", size=60)
-        font_small = ImageFont.truetype("C:/Windows/Fonts/GOUDOS.TTF", size=50)
+        fonts['large'] = ImageFont.truetype("C:/Windows/Fonts/GOUDOS.TTF", size=large)
+        fonts['medium'] = ImageFont.truetype("C:/Windows/Fonts/GOUDOS.TTF", size=medium)
+        fonts['small'] = ImageFont.truetype("C:/Windows/Fonts/GOUDOS.TTF", size=small)
         # Try to load bold versions
-        font_large_bold = ImageFont.truetype("C:/Windows/Fonts/GOUDOSB.TTF", size=70)
-        font_medium_bold = ImageFont.truetype("C:/Windows/Fonts/GOUDOSB.TTF", size=60)
-        font_small_bold = ImageFont.truetype("C:/Windows/Fonts/GOUDOSB.TTF", size=50)
+        fonts['large_bold'] = ImageFont.truetype("C:/Windows/Fonts/GOUDOSB.TTF", size=large)
+        fonts['medium_bold'] = ImageFont.truetype("C:/Windows/Fonts/GOUDOSB.TTF", size=medium)
+        fonts['small_bold'] = ImageFont.truetype("C:/Windows/Fonts/GOUDOSB.TTF", size=small)
     except:
         try:
-            font_large = ImageFont.truetype("arial.ttf", size=70)
-            font_medium = ImageFont.truetype("arial.ttf", size=60)
-            font_small = ImageFont.truetype("arial.ttf", size=50)
-            font_large_bold = ImageFont.truetype("arialbd.ttf", size=70)
-            font_medium_bold = ImageFont.truetype("arialbd.ttf", size=60)
-            font_small_bold = ImageFont.truetype("arialbd.ttf", size=50)
+            fonts['large'] = ImageFont.truetype("arial.ttf", size=large)
+            fonts['medium'] = ImageFont.truetype("arial.ttf", size=medium)
+            fonts['small'] = ImageFont.truetype("arial.ttf", size=small)
+            fonts['large_bold'] = ImageFont.truetype("arialbd.ttf", size=large)
+            fonts['medium_bold'] = ImageFont.truetype("arialbd.ttf", size=medium)
+            fonts['small_bold'] = ImageFont.truetype("arialbd.ttf", size=small)
         except:
-            font_large = ImageFont.load_default()
-            font_medium = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-            font_large_bold = ImageFont.load_default()
-            font_medium_bold = ImageFont.load_default()
-            font_small_bold = ImageFont.load_default()
-    
-    # Draw grid and text
-    for row in range(grid_size):
-        for col in range(grid_size):
-            # Calculate cell position
-            cell_x = card_x + col * cell_width
-            cell_y = card_y + row * cell_height
+            fonts['large'] = ImageFont.load_default()
+            fonts['medium'] = ImageFont.load_default()
+            fonts['small'] = ImageFont.load_default()
+            fonts['large_bold'] = ImageFont.load_default()
+            fonts['medium_bold'] = ImageFont.load_default()
+            fonts['small_bold'] = ImageFont.load_default()
+    
+    return fonts
+
+def _card_layout(template_width, bingo_start_y, scale):
+    """Return (card_x, card_y, cell_width, cell_height, border) of the card on the template."""
+    card_width = int(template_width * 0.85)  # 85% of template width for good fit
+    card_height = card_width  # Square card
+    
+    # Center horizontally
+    card_x = (template_width - card_width) // 2
+    card_y = round(bingo_start_y * scale)
+    
+    # Width of each cell's outline
+    border = max(1, round(3 * scale))
+    
+    return card_x, card_y, card_width // GRID_SIZE, card_height // GRID_SIZE, border
+
+def paint_card_grid(template_arr, bingo_start_y=950, dpi=TEMPLATE_DPI):
+    """Return a copy of the template pixels with the blank card grid painted in.
+    
+    The grid is the same on every card, so this runs once per batch and each
+    card only draws its text on top.
+    """
+    scale = dpi / TEMPLATE_DPI
+    card_x, card_y, cell_width, cell_height, border = _card_layout(template_arr.shape[1], bingo_start_y, scale)
+    
+    # Fill the whole card white in one write, then draw border-wide lines on
+    # the outer edge and wider lines between cells, where the borders of
+    # neighbouring cells overlap
+    canvas = template_arr.copy()
+    grid_right = card_x + GRID_SIZE * cell_width
+    grid_bottom = card_y + GRID_SIZE * cell_height
+    canvas[card_y:grid_bottom + 1, card_x:grid_right + 1] = 255
+    for i in range(GRID_SIZE + 1):
+        line_x = card_x + i * cell_width
+        line_y = card_y + i * cell_height
+        canvas[card_y:grid_bottom + 1, max(line_x - border + 1, card_x):min(line_x + border, grid_right + 1)] = 0
+        canvas[max(line_y - border + 1, card_y):min(line_y + border, grid_bottom + 1), card_x:grid_right + 1] = 0
+    
+    return canvas
+
+def draw_bingo_on_template(card, template_arr, fonts, output_path, bingo_start_y=950, dpi=TEMPLATE_DPI):
+    """Draw a bingo card's text on a fresh image built from the template pixels.
+    
+    template_arr must already have the grid painted in by paint_card_grid, and it
+    and fonts must already be scaled to dpi; positions and padding are given for
+    the 300 DPI template and scaled here.
+    """
+    scale = dpi / TEMPLATE_DPI
+    padding = round(20 * scale)
+    line_spacing = round(4 * scale)
+    card_x, card_y, cell_width, cell_height, border = _card_layout(template_arr.shape[1], bingo_start_y, scale)
+    
+    # Build the RGB image for the text
+    template = Image.fromarray(template_arr)
+    
+    font_large = fonts['large']
+    font_medium = fonts['medium']
+    font_small = fonts['small']
+    font_large_bold = fonts['large_bold']
+    font_medium_bold = fonts['medium_bold']
+    font_small_bold = fonts['small_bold']
+    
+    # Font tiers to try, largest first, for each size produced by format_square_text
+    tiers = [(font_large, font_large_bold), (font_medium, font_medium_bold), (font_small, font_small_bold)]
+    font_tiers = {70: tiers, 65: tiers, 60: tiers[1:], 45: tiers[2:]}
+    
+    # choose_fit shrinks text until it fits, so overflow only happens when a
+    # word is too wide even at the smallest size. As a last-resort guard each
+    # square's text is drawn on a crop of its cell's interior, so such text is
+    # clipped (with a warning) instead of spilling over the grid lines. Within
+    # a crop the cell's corner and center are the same for every cell
+    text_max_width = cell_width - 2 * padding
+    inner_width = cell_width - 2 * border
+    cell_x = cell_y = -border
+    text_center_x = cell_x + cell_width // 2
+    text_center_y = cell_y + cell_height // 2
+    
+    # Precompute each cell's interior box in row-major order
+    cell_boxes = [(x + border, y + border, x + cell_width - border + 1, y + cell_height - border + 1)
+                  for y in range(card_y, card_y + GRID_SIZE * cell_height, cell_height)
+                  for x in range(card_x, card_x + GRID_SIZE * cell_width, cell_width)]
+    flat_card = card.ravel()
+    
+    # Draw the text of each square
+    for cell_box, square_text in zip(cell_boxes, flat_card):
+        cell_image = template.crop(cell_box)
+        draw = ImageDraw.Draw(cell_image)
+        formatted_text = format_square_text(square_text)
+        
+        if len(formatted_text) == 1:
+            # Single line or block of text
+            text, font_size = formatted_text[0]
             
-            # Draw cell border
-            draw.rectangle([cell_x, cell_y, cell_x + cell_width, cell_y + cell_height], 
-                         outline='black', width=3, fill='white')
+            # Use the largest font that fits in at most 4 lines within the cell height
+            font_normal, font_bold, wrapped_lines = choose_fit(
+                text, font_tiers[font_size], text_max_width, 4,
+                max_height=cell_height - 2 * padding, line_spacing=line_spacing)
             
-            # Get square text
-            square_text = card[row][col]
-            formatted_text = format_square_text(square_text)
+            if any(_wrapped_line_width(line, font_normal, font_bold) > inner_width for line in wrapped_lines):
+                _warn_clipped(text)
             
-            # Calculate text position (center of cell)
-            text_center_x = cell_x + cell_width // 2
-            text_center_y = cell_y + cell_height // 2
+            if not any(is_bold for _, is_bold in parse_bold_text(text)):
+                # No bold text, so PIL can center and draw every line in one call
+                joined = '\n'.join(' '.join(word for word, _ in line_segments) for line_segments in wrapped_lines)
+                draw.multiline_text((text_center_x, text_center_y), joined, fill='black', font=font_normal,
+                                    anchor='mm', align='center', spacing=line_spacing)
             
-            if len(formatted_text) == 1:
-                # Single line or block of text
-                text, font_size = formatted_text[0]
-                font_normal = font_large if font_size >= 65 else font_medium if font_size >= 55 else font_small
-                font_bold = font_large_bold if font_size >= 65 else font_medium_bold if font_size >= 55 else font_small_bold
-                
-                # Wrap text with bold support
-                wrapped_lines = wrap_text_with_bold(text, font_normal, font_bold, cell_width - 40)
-                
-                # If text doesn't fit well, try smaller font
-                if len(wrapped_lines) > 4:  # Too many lines
-                    if font_normal == font_large:
-                        font_normal = font_medium
-                        font_bold = font_medium_bold
-                        wrapped_lines = wrap_text_with_bold(text, font_normal, font_bold, cell_width - 40)
-                    elif font_normal == font_medium:
-                        font_normal = font_small
-                        font_bold = font_small_bold
-                        wrapped_lines = wrap_text_with_bold(text, font_normal, font_bold, cell_width - 40)
-                
-                # Calculate total text height and ensure it fits in cell
-                line_height = font_normal.getbbox('Ay')[3] - font_normal.getbbox('Ay')[1] + 4
+            else:
+                # Calculate total text height
+                line_height = _line_height(font_normal) + line_spacing
                 total_height = len(wrapped_lines) * line_height
                 
-                # If text height exceeds cell height, reduce font size
-                max_height = cell_height - 40
-                if total_height > max_height:
-                    if font_normal == font_large:
-                        font_normal = font_medium
-                        font_bold = font_medium_bold
-                        wrapped_lines = wrap_text_with_bold(text, font_normal, font_bold, cell_width - 40)
-                        line_height = font_normal.getbbox('Ay')[3] - font_normal.getbbox('Ay')[1] + 4
-                        total_height = len(wrapped_lines) * line_height
-                    elif font_normal == font_medium and total_height > max_height:
-                        font_normal = font_small
-                        font_bold = font_small_bold
-                        wrapped_lines = wrap_text_with_bold(text, font_normal, font_bold, cell_width - 40)
-                        line_height = font_normal.getbbox('Ay')[3] - font_normal.getbbox('Ay')[1] + 4
-                        total_height = len(wrapped_lines) * line_height
-                
                 # Start from top of text block
                 start_y = text_center_y - total_height // 2
                 
@@ -340,8 +440,7 @@ def draw_bingo_on_template(card, template_path, output_path, bingo_start_y=950):
                     line_width = 0
                     for word, is_bold in line_segments:
                         font = font_bold if is_bold else font_normal
-                        bbox = font.getbbox(word + ' ')
-                        line_width += bbox[2] - bbox[0]
+                        line_width += _text_width(font, word + ' ')
                     
                     # Start x position for centered line
                     line_x = text_center_x - line_width // 2
@@ -355,120 +454,112 @@ def draw_bingo_on_template(card, template_path, output_path, bingo_start_y=950):
                         
                         draw.text((current_x, line_y), word_text, fill='black', font=font)
                         
-                        bbox = font.getbbox(word_text)
-                        current_x += bbox[2] - bbox[0]
+                        current_x += _text_width(font, word_text)
+        
+        else:
+            # Two lines with different sizes
+            line1, size1 = formatted_text[0]
+            line2, size2 = formatted_text[1]
+            
+            # Size the main text and +1 text independently so the +1 text never
+            # affects the main text size; the +1 text may use more lines first
+            font1_normal, font1_bold, wrapped_line1 = choose_fit(line1, font_tiers[size1], text_max_width, 2)
+            font2_normal, font2_bold, wrapped_line2 = choose_fit(line2, font_tiers[size2], text_max_width, 3)
+            
+            if any(_wrapped_line_width(line, font1_normal, font1_bold) > inner_width for line in wrapped_line1):
+                _warn_clipped(line1)
+            if any(_wrapped_line_width(line, font2_normal, font2_bold) > inner_width for line in wrapped_line2):
+                _warn_clipped(line2)
+            
+            # Calculate heights
+            line1_height = _line_height(font1_normal) + line_spacing // 2
+            line2_height = _line_height(font2_normal) + line_spacing // 2
+            
+            total_line1_height = len(wrapped_line1) * line1_height
+            total_line2_height = len(wrapped_line2) * line2_height
+            
+            # Position +1 text (line2) at bottom of cell - always bottom aligned
+            start_y2 = cell_y + cell_height - total_line2_height - padding  # Fixed distance from bottom
             
+            # Try to center main text, but avoid overlap with +1 text
+            min_gap = padding  # Minimum space between main text and +1 text
+            ideal_center_y = text_center_y - total_line1_height // 2
+            max_main_text_bottom = start_y2 - min_gap
+            
+            # If centered main text would overlap, move it up
+            if ideal_center_y + total_line1_height > max_main_text_bottom:
+                start_y1 = max_main_text_bottom - total_line1_height
             else:
-                # Two lines with different sizes
-                line1, size1 = formatted_text[0]
-                line2, size2 = formatted_text[1]
-                
-                font1_normal = font_large if size1 >= 65 else font_medium if size1 >= 55 else font_small
-                font2_normal = font_large if size2 >= 65 else font_medium if size2 >= 55 else font_small
-                font1_bold = font_large_bold if size1 >= 65 else font_medium_bold if size1 >= 55 else font_small_bold
-                font2_bold = font_large_bold if size2 >= 65 else font_medium_bold if size2 >= 55 else font_small_bold
-                
-                # Wrap both lines with better padding and bold support
-                wrapped_line1 = wrap_text_with_bold(line1, font1_normal, font1_bold, cell_width - 40)
-                wrapped_line2 = wrap_text_with_bold(line2, font2_normal, font2_bold, cell_width - 40)
-                
-                # Auto-adjust font sizes ONLY if the main text (line1) doesn't fit
-                # Don't let +1 text affect main text sizing
-                if len(wrapped_line1) > 2:  # Too many lines for first text
-                    if font1_normal == font_large:
-                        font1_normal = font_medium
-                        font1_bold = font_medium_bold
-                        wrapped_line1 = wrap_text_with_bold(line1, font1_normal, font1_bold, cell_width - 40)
-                    elif font1_normal == font_medium:
-                        font1_normal = font_small
-                        font1_bold = font_small_bold
-                        wrapped_line1 = wrap_text_with_bold(line1, font1_normal, font1_bold, cell_width - 40)
-                
-                # For +1 text (line2), allow more aggressive sizing if needed without affecting line1
-                if len(wrapped_line2) > 3:  # Allow more lines for +1 text before reducing
-                    if font2_normal == font_large:
-                        font2_normal = font_medium
-                        font2_bold = font_medium_bold
-                        wrapped_line2 = wrap_text_with_bold(line2, font2_normal, font2_bold, cell_width - 40)
-                    elif font2_normal == font_medium:
-                        font2_normal = font_small
-                        font2_bold = font_small_bold
-                        wrapped_line2 = wrap_text_with_bold(line2, font2_normal, font2_bold, cell_width - 40)
-                
-                # Calculate heights
-                line1_height = font1_normal.getbbox('Ay')[3] - font1_normal.getbbox('Ay')[1] + 2
-                line2_height = font2_normal.getbbox('Ay')[3] - font2_normal.getbbox('Ay')[1] + 2
-                
-                total_line1_height = len(wrapped_line1) * line1_height
-                total_line2_height = len(wrapped_line2) * line2_height
-                
-                # Position +1 text (line2) at bottom of cell - always bottom aligned
-                start_y2 = cell_y + cell_height - total_line2_height - 20  # Fixed distance from bottom
-                
-                # Try to center main text, but avoid overlap with +1 text
-                min_gap = 20  # Minimum space between main text and +1 text
-                ideal_center_y = text_center_y - total_line1_height // 2
-                max_main_text_bottom = start_y2 - min_gap
-                
-                # If centered main text would overlap, move it up
-                if ideal_center_y + total_line1_height > max_main_text_bottom:
-                    start_y1 = max_main_text_bottom - total_line1_height
-                else:
-                    start_y1 = ideal_center_y
+                start_y1 = ideal_center_y
+            
+            # Ensure main text doesn't go above cell top
+            min_y1 = cell_y + padding
+            if start_y1 < min_y1:
+                start_y1 = min_y1
+            
+            for i, line_segments in enumerate(wrapped_line1):
+                # Calculate line width to center it
+                line_width = 0
+                for word, is_bold in line_segments:
+                    font = font1_bold if is_bold else font1_normal
+                    line_width += _text_width(font, word + ' ')
                 
-                # Ensure main text doesn't go above cell top
-                min_y1 = cell_y + 20
-                if start_y1 < min_y1:
-                    start_y1 = min_y1
+                line_x = text_center_x - line_width // 2
+                line_y = start_y1 + i * line1_height
                 
-                for i, line_segments in enumerate(wrapped_line1):
-                    # Calculate line width to center it
-                    line_width = 0
-                    for word, is_bold in line_segments:
-                        font = font1_bold if is_bold else font1_normal
-                        bbox = font.getbbox(word + ' ')
-                        line_width += bbox[2] - bbox[0]
+                # Draw each segment in the line
+                current_x = line_x
+                for j, (word, is_bold) in enumerate(line_segments):
+                    font = font1_bold if is_bold else font1_normal
+                    word_text = word + (' ' if j < len(line_segments) - 1 else '')
                     
-                    line_x = text_center_x - line_width // 2
-                    line_y = start_y1 + i * line1_height
+                    draw.text((current_x, line_y), word_text, fill='black', font=font)
                     
-                    # Draw each segment in the line
-                    current_x = line_x
-                    for j, (word, is_bold) in enumerate(line_segments):
-                        font = font1_bold if is_bold else font1_normal
-                        word_text = word + (' ' if j < len(line_segments) - 1 else '')
-                        
-                        draw.text((current_x, line_y), word_text, fill='black', font=font)
-                        
-                        bbox = font.getbbox(word_text)
-                        current_x += bbox[2] - bbox[0]
+                    current_x += _text_width(font, word_text)
+            
+            for i, line_segments in enumerate(wrapped_line2):
+                # Calculate line width to center it
+                line_width = 0
+                for word, is_bold in line_segments:
+                    font = font2_bold if is_bold else font2_normal
+                    line_width += _text_width(font, word + ' ')
                 
-                for i, line_segments in enumerate(wrapped_line2):
-                    # Calculate line width to center it
-                    line_width = 0
-                    for word, is_bold in line_segments:
-                        font = font2_bold if is_bold else font2_normal
-                        bbox = font.getbbox(word + ' ')
-                        line_width += bbox[2] - bbox[0]
+                line_x = text_center_x - line_width // 2
+                line_y = start_y2 + i * line2_height
+                
+                # Draw each segment in the line
+                current_x = line_x
+                for j, (word, is_bold) in enumerate(line_segments):
+                    font = font2_bold if is_bold else font2_normal
+                    word_text = word + (' ' if j < len(line_segments) - 1 else '')
                     
-                    line_x = text_center_x - line_width // 2
-                    line_y = start_y2 + i * line2_height
+                    draw.text((current_x, line_y), word_text, fill='black', font=font)
                     
-                    # Draw each segment in the line
-                    current_x = line_x
-                    for j, (word, is_bold) in enumerate(line_segments):
-                        font = font2_bold if is_bold else font2_normal
-                        word_text = word + (' ' if j < len(line_segments) - 1 else '')
-                        
-                        draw.text((current_x, line_y), word_text, fill='black', font=font)
-                        
-                        bbox = font.getbbox(word_text)
-                        current_x += bbox[2] - bbox[0]
+                    current_x += _text_width(font, word_text)
+        
+        template.paste(cell_image, cell_box[:2])
     
-    # Save the final image
-    template.save(output_path, 'PNG', quality=95, dpi=(300, 300))
+    # Save the final image with light, fast compression; create_pdf.py
+    # re-encodes the pixels when embedding, so a smaller PNG gains nothing
+    template.save(output_path, 'PNG', optimize=False, compress_level=1, dpi=(dpi, dpi))
     return output_path
 
+# Template, fonts and render DPI for the current worker process, set by _init_worker
+_worker_template = None
+_worker_fonts = None
+_worker_dpi = TEMPLATE_DPI
+
+def _init_worker(template_arr, dpi):
+    """Store the template pixels and load fonts once per worker process."""
+    global _worker_template, _worker_fonts, _worker_dpi
+    _worker_template = template_arr
+    _worker_fonts = load_fonts(dpi / TEMPLATE_DPI)
+    _worker_dpi = dpi
+
+def _render_one(card, output_path):
+    """Draw one card in a worker process using its preloaded template and fonts."""
+    return draw_bingo_on_template(card, _worker_template, _worker_fonts, output_path, dpi=_worker_dpi)
+
 def main():
     """Generate individual bingo cards on templates."""
     try:
@@ -486,25 +577,50 @@ def main():
                 print("Invalid input. Using default of 12.")
                 num_cards = 12
         
+        # Draft cards render at a lower resolution, which is much faster
+        draft_input = input(f"Generate quick draft cards at {DRAFT_DPI} DPI? (y/N): ").strip().lower()
+        dpi = DRAFT_DPI if draft_input in ('y', 'yes') else TEMPLATE_DPI
+        
+        # An optional seed makes the same set of cards come out every time
+        seed_input = input("Random seed for reproducible cards (optional): ").strip()
+        seed = None
+        if seed_input:
+            try:
+                seed = int(seed_input)
+            except ValueError:
+                print("Invalid seed. Using a random one.")
+        
         # Create finals directory if it doesn't exist
         os.makedirs('finals', exist_ok=True)
         
         # Parse the bingo file
-        squares = parse_bingo_file('bingo.txt')
+        squares = np.array(parse_bingo_file('bingo.txt'), dtype=object)
         print(f"Loaded {len(squares)} bingo squares")
         
-        # Generate unique bingo cards
-        for i in range(1, num_cards + 1):
-            print(f"Generating bingo card {i}/{num_cards}...")
-            
-            # Create a unique bingo card
-            card = create_bingo_card(squares)
-            
-            # Draw on template and save
-            output_filename = f"finals/bingo_card_{i:02d}.png"
-            draw_bingo_on_template(card, 'bingo.png', output_filename)
+        # Decode (and for drafts, downscale) the template and paint the blank
+        # grid once; workers receive the raw pixel array
+        template = Image.open('bingo.png').convert('RGB')
+        if dpi != TEMPLATE_DPI:
+            scale = dpi / TEMPLATE_DPI
+            template = template.resize((round(template.width * scale), round(template.height * scale)),
+                                       Image.LANCZOS)
+        template_arr = paint_card_grid(np.asarray(template), dpi=dpi)
+        
+        # Create unique cards up front so shuffling stays in this process
+        rng = np.random.default_rng(seed)
+        card_indices = generate_card_indices(len(squares) - 1, num_cards, rng)
+        cards = [create_bingo_card(squares, indices) for indices in card_indices]
+        
+        # Draw and save cards in parallel, one process per core
+        print(f"Generating {num_cards} bingo cards...")
+        max_workers = min(os.cpu_count() or 1, num_cards)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(template_arr, dpi)) as executor:
+            futures = [executor.submit(_render_one, card, f"finals/bingo_card_{i:02d}.png")
+                       for i, card in enumerate(cards, start=1)]
             
-            print(f"Saved: {output_filename}")
+            for done, future in enumerate(as_completed(futures), start=1):
+                print(f"Saved: {future.result()} ({done}/{num_cards})")
         
         print(f"\nAll {num_cards} bingo cards generated successfully in the 'finals' folder!")
         